@@ -1,7 +1,61 @@
+import zlib
+
+from sqlalchemy import LargeBinary, TypeDecorator
+from sqlalchemy.orm import deferred, validates
+
 from dbs import db
 
+# Bodies at or above this size (in UTF-8 bytes) are zlib-compressed at rest
+COMPRESS_THRESHOLD = 4096
+SUMMARY_LENGTH = 200
+
+# One-byte prefix telling whether the stored payload is plain or compressed
+_RAW = b'r'
+_ZLIB = b'z'
+
+
+class CompressedText(TypeDecorator):
+    """Unbounded text stored as bytes, transparently compressed when large"""
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        data = value.encode('utf-8')
+        if len(data) >= COMPRESS_THRESHOLD:
+            return _ZLIB + zlib.compress(data)
+        return _RAW + data
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        value = bytes(value)
+        if value[:1] == _ZLIB:
+            return zlib.decompress(value[1:]).decode('utf-8')
+        return value[1:].decode('utf-8')
+
+
+def make_summary(content):
+    """Build the short plain-text snippet shown in book lists"""
+    text = ' '.join((content or '').split())
+    if len(text) <= SUMMARY_LENGTH:
+        return text
+    return text[:SUMMARY_LENGTH - 1].rstrip() + '…'
+
 
 class Book(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(150), unique=True, nullable=False)
-    content = db.Column(db.String(350), nullable=False)
+    summary = db.Column(db.String(SUMMARY_LENGTH), nullable=False, default='')
+    # Full body is only loaded on access (or with undefer), never by list queries
+    content = deferred(db.Column(CompressedText, nullable=False))
+
+    @validates('content')
+    def update_summary(self, key, content):
+        """Keep the stored summary in sync whenever the body changes"""
+        self.summary = make_summary(content)
+        return content
+
+    def __repr__(self):
+        return f'<Book {self.name}>'
@@ -4,6 +4,7 @@ import logging
 from flask import render_template, flash, redirect, url_for
 from flask_babel import gettext as _
 from flask_login import login_required
+from sqlalchemy.orm import undefer
 
 from book import bp
 from book.forms import BookForm
@@ -18,7 +19,7 @@ logger = logging.getLogger(__name__)
 def create_book():
     """Display books list and handle book creation"""
     form = BookForm()
-    # Optimization: If Book model has user association, can use joinedload
+    # Book.content is deferred, so list queries only load name and summary
     books = Book.query.all()
     if form.validate_on_submit():
         book = Book(
@@ -42,4 +43,12 @@ def create_book():
 def books():
     form = BookForm()
     books = Book.query.all()
-    return render_template('books.html', books=books, form=form)
\ No newline at end of file
+    return render_template('books.html', books=books, form=form)
+
+
+@bp.route('/<int:book_id>', methods=['GET'])
+@login_required
+def book_detail(book_id):
+    """Display a single book with its full content"""
+    book = Book.query.options(undefer(Book.content)).filter_by(id=book_id).first_or_404()
+    return render_template('book_detail.html', book=book)
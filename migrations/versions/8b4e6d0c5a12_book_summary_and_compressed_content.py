@@ -0,0 +1,99 @@
+"""book summary and compressed content
+
+Store book bodies in an unbounded, compressed-at-rest column and add a
+precomputed summary so list pages never need to read the body.
+
+Revision ID: 8b4e6d0c5a12
+Revises: 3f1c2a9d7e01
+Create Date: 2026-10-19 10:30:00.000000
+
+"""
+import zlib
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b4e6d0c5a12'
+down_revision = '3f1c2a9d7e01'
+branch_labels = None
+depends_on = None
+
+# Frozen copies of the storage format in book/models.py, so this revision
+# keeps working if the model code changes later
+COMPRESS_THRESHOLD = 4096
+SUMMARY_LENGTH = 200
+
+book = sa.table(
+    'book',
+    sa.column('id', sa.Integer),
+    sa.column('content', sa.String),
+    sa.column('summary', sa.String),
+    sa.column('body', sa.LargeBinary),
+)
+
+
+def _encode(text):
+    data = text.encode('utf-8')
+    if len(data) >= COMPRESS_THRESHOLD:
+        return b'z' + zlib.compress(data)
+    return b'r' + data
+
+
+def _decode(value):
+    value = bytes(value)
+    if value[:1] == b'z':
+        return zlib.decompress(value[1:]).decode('utf-8')
+    return value[1:].decode('utf-8')
+
+
+def _summary(text):
+    text = ' '.join(text.split())
+    if len(text) <= SUMMARY_LENGTH:
+        return text
+    return text[:SUMMARY_LENGTH - 1].rstrip() + '…'
+
+
+def upgrade():
+    with op.batch_alter_table('book', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('summary', sa.String(length=SUMMARY_LENGTH), nullable=True))
+        batch_op.add_column(sa.Column('body', sa.LargeBinary(), nullable=True))
+
+    conn = op.get_bind()
+    for book_id, content in conn.execute(sa.select(book.c.id, book.c.content)).fetchall():
+        conn.execute(
+            book.update()
+            .where(book.c.id == book_id)
+            .values(summary=_summary(content), body=_encode(content))
+        )
+
+    with op.batch_alter_table('book', schema=None) as batch_op:
+        batch_op.drop_column('content')
+        batch_op.alter_column('body', new_column_name='content',
+                              existing_type=sa.LargeBinary(), nullable=False)
+        batch_op.alter_column('summary', existing_type=sa.String(length=SUMMARY_LENGTH),
+                              nullable=False)
+
+
+def downgrade():
+    # Lossy: bodies longer than the old 350 character limit are truncated
+    with op.batch_alter_table('book', schema=None) as batch_op:
+        batch_op.alter_column('content', new_column_name='body',
+                              existing_type=sa.LargeBinary(), nullable=True)
+    with op.batch_alter_table('book', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('content', sa.String(length=350), nullable=True))
+
+    conn = op.get_bind()
+    for book_id, body in conn.execute(sa.select(book.c.id, book.c.body)).fetchall():
+        conn.execute(
+            book.update()
+            .where(book.c.id == book_id)
+            .values(content=_decode(body)[:350])
+        )
+
+    with op.batch_alter_table('book', schema=None) as batch_op:
+        batch_op.drop_column('body')
+        batch_op.drop_column('summary')
+        batch_op.alter_column('content', existing_type=sa.String(length=350),
+                              nullable=False)